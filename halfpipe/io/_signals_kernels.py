@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+
+"""
+Compiled kernels for the label reductions in signals.py
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _label_means_numpy(data, labels, nlabel):
+    counts = np.bincount(labels, minlength=nlabel + 1)
+
+    sums = np.empty((data.shape[0], nlabel + 1), dtype=np.float64)
+    for i, frame in enumerate(data):
+        sums[i, :] = np.bincount(labels, weights=frame, minlength=nlabel + 1)
+
+    return sums, counts
+
+
+def _mask_and_count_numpy(labels, mask, nlabel, background_label):
+    pre_counts = np.bincount(labels, minlength=nlabel + 1)
+
+    if background_label == 0:
+        # multiplying by the mask zeroes the voxels outside it without
+        # allocating a negated full-volume boolean temporary
+        np.multiply(labels, mask, out=labels, casting="unsafe")
+    else:
+        np.copyto(labels, np.int32(background_label), where=np.logical_not(mask))
+
+    post_counts = np.bincount(labels, minlength=nlabel + 1)
+
+    return pre_counts, post_counts
+
+
+if njit is not None:
+
+    # voxel tile size chosen so that the label tile stays resident in L1
+    # while all frames are accumulated over it
+    block_size = 4096
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def label_means(data, labels, nlabel):
+        """
+        fused reduction (labels, data) -> (sums, counts) that streams
+        each voxel exactly once
+        """
+        nt, n = data.shape
+
+        counts = np.zeros(nlabel + 1, dtype=np.int64)
+        for i in range(n):
+            counts[labels[i]] += 1
+
+        # accumulate all frames over one voxel tile before moving on, so
+        # that the labels are read from main memory once per tile rather
+        # than once per frame
+        sums = np.zeros((nt, nlabel + 1), dtype=np.float64)
+        for n0 in range(0, n, block_size):
+            n1 = min(n0 + block_size, n)
+            for t in prange(nt):
+                for i in range(n0, n1):
+                    sums[t, labels[i]] += data[t, i]
+
+        return sums, counts
+
+    @njit(cache=True)
+    def mask_and_count(labels, mask, nlabel, background_label):
+        """
+        apply the brain mask to the label array in place while counting
+        label occurrences before and after masking in the same pass
+        """
+        pre_counts = np.zeros(nlabel + 1, dtype=np.int64)
+        post_counts = np.zeros(nlabel + 1, dtype=np.int64)
+
+        for i in range(labels.size):
+            label = labels[i]
+            pre_counts[label] += 1
+            if not mask[i]:
+                label = background_label
+                labels[i] = label
+            post_counts[label] += 1
+
+        return pre_counts, post_counts
+
+else:
+    label_means = _label_means_numpy
+    mask_and_count = _mask_and_count_numpy
@@ -10,9 +10,8 @@ Adapted from https://github.com/Neurita/pypes
 import numpy as np
 import nibabel as nib
 
-from scipy.ndimage.measurements import mean
-
 from ..utils import nvol
+from ._signals_kernels import label_means, mask_and_count
 
 
 def meansignals(in_file, atlas_file, mask_file=None, background_label=0, min_region_coverage=0.5, output_coverage=False):
@@ -22,7 +21,7 @@ def meansignals(in_file, atlas_file, mask_file=None, background_label=0, min_reg
     assert nvol(atlas_img) == 1
     assert atlas_img.shape[:3] == in_img.shape[:3]
     assert np.allclose(atlas_img.affine, in_img.affine)
-    labels = np.asanyarray(atlas_img.dataobj).astype(np.int32)
+    labels = np.asarray(atlas_img.dataobj, dtype=np.int32)
 
     nlabel = labels.max()
 
@@ -30,6 +29,8 @@ def meansignals(in_file, atlas_file, mask_file=None, background_label=0, min_reg
 
     indices = np.arange(0, nlabel + 1, dtype=np.int32)
 
+    flat_labels = np.ravel(labels)  # view that allows masking in place
+
     out_region_coverage = None
 
     if mask_file is not None:
@@ -37,15 +38,13 @@ def meansignals(in_file, atlas_file, mask_file=None, background_label=0, min_reg
         assert nvol(mask_img) == 1
         assert mask_img.shape[:3] == in_img.shape[:3]
         assert np.allclose(mask_img.affine, in_img.affine)
-        mask_data = np.asanyarray(mask_img.dataobj).astype(np.bool)
-
-        pre_counts = np.bincount(np.ravel(labels), minlength=nlabel + 1)
-        pre_counts = pre_counts[:nlabel + 1].astype(np.float64)
-
-        labels[np.logical_not(mask_data)] = background_label
+        mask_data = np.asarray(mask_img.dataobj, dtype=bool)
 
-        post_counts = np.bincount(np.ravel(labels), minlength=nlabel + 1)
-        post_counts = post_counts[:nlabel + 1].astype(np.float64)
+        pre_counts, post_counts = mask_and_count(
+            flat_labels, np.ravel(mask_data), nlabel, background_label
+        )
+        pre_counts = pre_counts.astype(np.float64)
+        post_counts = post_counts.astype(np.float64)
 
         region_coverage = post_counts / pre_counts
         region_coverage[np.isclose(pre_counts, 0)] = 0
@@ -55,18 +54,32 @@ def meansignals(in_file, atlas_file, mask_file=None, background_label=0, min_reg
 
         indices = indices[region_coverage >= min_region_coverage]
 
-    indices = np.setdiff1d(indices, [background_label])
+    indices = indices[indices != background_label]
 
     assert np.all(labels >= 0)
 
-    in_data = in_img.get_fdata()
+    # load as float32 to halve memory traffic; the kernel accumulates
+    # in float64, so precision of the means is unaffected
+    in_data = np.asarray(in_img.dataobj, dtype=np.float32)
     if in_data.ndim == 3:
         in_data = in_data[:, :, :, np.newaxis]
     assert in_data.ndim == 4
 
-    result = np.full((in_data.shape[3], nlabel), np.nan)
-    for i, img in enumerate(np.moveaxis(in_data, 3, 0)):
-        result[i, indices - 1] = mean(img, labels=labels.reshape(img.shape), index=indices)
+    nt = in_data.shape[3]
+
+    # reduce all frames in one pass over the flattened labels instead of
+    # re-indexing the label volume once per frame. the strided moveaxis
+    # view is copied into a c-contiguous time-major array once, so each
+    # frame row is a sequential read for the kernel
+    in_data_2d = np.ascontiguousarray(np.moveaxis(in_data, 3, 0)).reshape((nt, -1))
+    del in_data  # free the (x, y, z, t) buffer before running the kernel
+
+    sums, counts = label_means(in_data_2d, flat_labels, nlabel)
+    counts = counts.astype(np.float64)
+
+    result = np.full((nt, nlabel), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result[:, indices - 1] = sums[:, indices] / counts[indices]
 
     if output_coverage is True:
         return result, out_region_coverage
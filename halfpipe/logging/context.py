@@ -10,6 +10,13 @@ from .worker import run as runWorker, MessageSchema
 
 schema = MessageSchema()
 
+# the control messages are constant, so serialize them once at import
+# instead of running marshmallow for every call
+payloads = {
+    type: schema.dump({"type": type})
+    for type in ("teardown", "enable_verbose", "enable_print", "disable_print")
+}
+
 
 class Context(object):
     _instance = None
@@ -32,8 +39,7 @@ class Context(object):
                 cls.queue().join()
 
                 # send message with teardown command
-                obj = schema.dump({"type": "teardown"})
-                cls.queue().put(obj)
+                cls.queue().put(payloads["teardown"])
 
                 # wait up to one second
                 cls.instance().worker.join(1.0)
@@ -51,19 +57,16 @@ class Context(object):
 
     @classmethod
     def enableVerbose(cls):
-        obj = schema.dump({"type": "enable_verbose"})
-        cls.queue().put(obj)
+        cls.queue().put(payloads["enable_verbose"])
 
     @classmethod
     def enablePrint(cls):
-        obj = schema.dump({"type": "enable_print"})
-        cls.queue().put(obj)
+        cls.queue().put(payloads["enable_print"])
         cls.queue().join()
 
     @classmethod
     def disablePrint(cls):
-        obj = schema.dump({"type": "disable_print"})
-        cls.queue().put(obj)
+        cls.queue().put(payloads["disable_print"])
         cls.queue().join()
 
     @classmethod
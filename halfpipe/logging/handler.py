@@ -4,9 +4,7 @@
 
 from logging import Handler
 
-from .worker import MessageSchema
-
-schema = MessageSchema()
+from .worker import Message
 
 
 class QueueHandler(Handler):
@@ -17,7 +15,9 @@ class QueueHandler(Handler):
     def emit(self, record):
         try:
             msg = self.format(record)
-            obj = schema.dump({"type": "log", "msg": msg, "levelno": record.levelno})
-            self.queue.put(obj)
+            # put a Message object directly; the listener accepts these
+            # as-is, so each log record skips a marshmallow dump here and
+            # a validating load on the worker side
+            self.queue.put(Message(type="log", msg=msg, levelno=record.levelno))
         except Exception:
             self.handleError(record)
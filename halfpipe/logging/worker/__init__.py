@@ -4,6 +4,6 @@
 
 from .base import run
 
-from .message import MessageSchema
+from .message import Message, MessageSchema
 
-__all__ = ["run", "MessageSchema"]
+__all__ = ["run", "Message", "MessageSchema"]
@@ -4,10 +4,10 @@
 
 from typing import Optional
 
+from functools import lru_cache
 from os import getenv
 from pathlib import Path
-from templateflow import api
-import templateflow
+import pickle
 
 default_resource_dir = Path.home() / ".cache" / "halfpipe"
 resource_dir = Path(
@@ -34,14 +34,33 @@ online_resources = dict([
     ),
 ])
 
-xfmpaths = api.get("MNI152NLin2009cAsym", suffix="xfm")
 templateflow_resources = dict()
 
 
+@lru_cache(maxsize=None)
+def xfmpaths():
+    """
+    lazily query templateflow for the transform files, so that merely
+    importing this module, for example in a worker process, does not
+    trigger a templateflow scan
+    """
+    cachefilepath = resource_dir / "xfmpaths.pkl"
+    if cachefilepath.exists():
+        return pickle.loads(cachefilepath.read_bytes())
+
+    from templateflow import api
+
+    paths = api.get("MNI152NLin2009cAsym", suffix="xfm")
+    cachefilepath.write_bytes(pickle.dumps(paths))
+
+    return paths
+
+
 def download(url: str, target=None) -> Optional[str]:
     import requests
     from tqdm import tqdm
     import io
+    import os
 
     if target is not None:
         fp = open(target, "wb")
@@ -52,7 +71,16 @@ def download(url: str, target=None) -> Optional[str]:
 
     with requests.get(url, stream=True) as rq:
         total_size = int(rq.headers.get("content-length", 0))
-        block_size = 1024
+
+        # preallocate so that the file system can lay out the target
+        # contiguously instead of growing it block by block
+        if target is not None and total_size > 0:
+            try:
+                os.posix_fallocate(fp.fileno(), 0, total_size)
+            except (AttributeError, OSError):
+                pass  # not supported on this platform or file system
+
+        block_size = 1 << 20  # 1 MiB blocks keep large downloads disk-bound
 
         t = tqdm(total=total_size, unit="B", unit_scale=True)
 
@@ -100,6 +128,8 @@ def get(filename=None) -> str:
 
 
 if __name__ == "__main__":
+    from templateflow import api
+
     spaces = ["MNI152NLin6Asym", "MNI152NLin2009cAsym"]
     for space in spaces:
         paths = api.get(space, atlas=None)
@@ -4,7 +4,6 @@
 
 from typing import Dict, List, Tuple
 
-from itertools import product
 from collections import OrderedDict
 from pathlib import Path
 
@@ -26,11 +25,14 @@ def _check_multicollinearity(matrix):
 
     logger.info("Checking for multicollinearity in the model..")
 
-    _, s, _ = np.linalg.svd(matrix)
+    s = np.linalg.svd(matrix, compute_uv=False)
     max_singular = np.max(s)
     min_singular = np.min(s)
 
-    rank = np.linalg.matrix_rank(matrix)
+    # derive the rank from the singular values with the same tolerance
+    # that matrix_rank would use, instead of running a second svd
+    tol = max_singular * max(matrix.shape) * np.finfo(s.dtype).eps
+    rank = int(np.count_nonzero(s > tol))
 
     logger.info(
         f"max_singular={max_singular} min_singular={min_singular} "
@@ -57,11 +59,10 @@ def group_design(
 
     assert id_column is not None, "Missing id column, cannot specify model"
 
-    rawdataframe[id_column] = pd.Series(rawdataframe[id_column], dtype=str)
-    if all(str(id).startswith("sub-") for id in rawdataframe[id_column]):  # for bids
-        rawdataframe[id_column] = [
-            str(id).replace("sub-", "") for id in rawdataframe[id_column]
-        ]
+    ids = rawdataframe[id_column].astype(str)
+    if ids.str.startswith("sub-").all():  # for bids
+        ids = ids.str.replace("sub-", "", regex=False)
+    rawdataframe[id_column] = ids
     rawdataframe = rawdataframe.set_index(id_column)
 
     continuous_columns = []
@@ -97,14 +98,24 @@ def group_design(
     categorical = categorical.astype(str)
     categorical = categorical.astype("category")
 
-    # merge
-    dataframe = categorical.join(continuous, how="outer").loc[subjects, :]
+    # merge; both frames are already aligned to the subjects list, so a
+    # plain concat avoids the join machinery and its index buffers
+    dataframe = pd.concat([categorical, continuous], axis=1)
 
     # maintain order
     dataframe = dataframe[columns_in_order]
 
-    # remove zero variance columns
-    columns_var_gt_0 = dataframe.apply(pd.Series.nunique) > 1  # does not count NA
+    # remove zero variance columns; count unique values per dtype instead
+    # of dispatching pd.Series.nunique through apply. for categorical
+    # columns the category index gives the count without a hash table
+    nunique = dict()
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            nunique[column] = len(series.cat.remove_unused_categories().cat.categories)
+        else:
+            nunique[column] = series.nunique()  # does not count NA
+    columns_var_gt_0 = pd.Series(nunique) > 1
     dataframe = dataframe.loc[:, columns_var_gt_0]
 
     # don't need to specify lhs
@@ -135,9 +146,19 @@ def group_design(
         else dataframe[f].unique()
         for f in dataframe.columns
     ]
-    grid = pd.DataFrame(
-        list(product(*uniqueValuesForCategorical)), columns=dataframe.columns
-    )
+    # build the cartesian product grid column by column with repeat and
+    # tile instead of materializing a python tuple per row, so that the
+    # allocations are linear in the number of columns
+    sizes = [len(uniqueValues) for uniqueValues in uniqueValuesForCategorical]
+    gridSize = int(np.prod(sizes))
+    repeats = gridSize
+    gridColumns = dict()
+    for column, uniqueValues in zip(dataframe.columns, uniqueValuesForCategorical):
+        uniqueValues = np.asarray(uniqueValues)
+        repeats //= uniqueValues.size
+        tiles = gridSize // (uniqueValues.size * repeats)
+        gridColumns[column] = np.tile(np.repeat(uniqueValues, repeats), tiles)
+    grid = pd.DataFrame(gridColumns, columns=dataframe.columns)
     refDmat = dmatrix(dmat.design_info, grid, return_type="dataframe")
 
     # data frame to store contrasts
@@ -162,9 +183,9 @@ def group_design(
             # variable at the factor level.
             # For example, we would have one row that calculates the mean
             # for patients, and one for controls.
-            lsmeans = pd.DataFrame(index=variableLevels, columns=dmat.columns)
-            for level in variableLevels:
-                lsmeans.loc[level, :] = refDmat.loc[grid[variable] == level, :].mean()
+            lsmeans = (
+                refDmat.groupby(grid[variable].values).mean().reindex(variableLevels)
+            )
             valueDict = contrastdict["values"]
             names = [name for name in valueDict.keys() if name in variableLevels]
             values = [valueDict[name] for name in names]
@@ -8,6 +8,7 @@
 from typing import List, Dict, Optional, Tuple
 
 import os
+from collections import defaultdict
 from pathlib import Path
 from multiprocessing import get_context
 from multiprocessing.pool import Pool
@@ -122,7 +123,7 @@ def fit(
         it = cm.imap_unordered(voxel_calc, voxel_data)
 
     # run
-    voxel_results = dict()
+    voxel_results: Dict = defaultdict(lambda: defaultdict(dict))
     with cm:
         for x in tqdm(it, unit="voxels"):
             if x is None:
@@ -132,16 +133,10 @@ def fit(
                 if d is None:
                     continue
 
-                if a not in voxel_results:
-                    voxel_results[a] = dict()
-
                 for k, v in d.items():
                     if v is None:
                         continue
 
-                    if k not in voxel_results[a]:
-                        voxel_results[a][k] = dict()
-
                     voxel_results[a][k].update(v)
 
         if isinstance(cm, Pool):
@@ -8,6 +8,8 @@ import pytest
 
 import os
 import tarfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from ...tests.resource import setup as setuptestresources
@@ -66,6 +68,19 @@ def mni_downsampled(tmp_path_factory):
     return result.outputs.output_image
 
 
+def _downsample(in_file, reference_image=None):
+    result = ants.ApplyTransforms(
+        dimension=3,
+        input_image_type=0,
+        input_image=in_file,
+        reference_image=reference_image,
+        interpolation="NearestNeighbor",
+        transforms=["identity"],
+    ).run()
+
+    return result.outputs.output_image
+
+
 @pytest.fixture(scope="package")
 def wakemandg_hensonrn_downsampled(
     tmp_path_factory, wakemandg_hensonrn, mni_downsampled
@@ -74,23 +89,32 @@ def wakemandg_hensonrn_downsampled(
 
     os.chdir(str(tmp_path))
 
-    data = dict()
-
-    def _downsample(in_file):
-        result = ants.ApplyTransforms(
-            dimension=3,
-            input_image_type=0,
-            input_image=in_file,
-            reference_image=mni_downsampled,
-            interpolation="NearestNeighbor",
-            transforms=["identity"],
-        ).run()
+    files = [
+        f
+        for v in wakemandg_hensonrn.values()
+        if isinstance(v, list)
+        for f in v
+        if Path(f).exists()
+    ]
+
+    # each call shells out to ants, so downsample the files in parallel
+    with ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, len(files))
+    ) as executor:
+        downsampled = dict(
+            zip(
+                files,
+                executor.map(
+                    partial(_downsample, reference_image=mni_downsampled), files
+                ),
+            )
+        )
 
-        return result.outputs.output_image
+    data = dict()
 
     for k, v in wakemandg_hensonrn.items():
         if isinstance(v, list):
-            data[k] = [_downsample(f) if Path(f).exists() else f for f in v]
+            data[k] = [downsampled.get(f, f) for f in v]
         else:
             data[k] = v
 
@@ -6,6 +6,7 @@ from .copy import deepcopyfactory, deepcopy
 from .format import formatlist, cleaner, formatlikebids
 from .hash import hexdigest, b32digest
 from .image import niftidim, nvol
+from .json import NumpyJSONEncoder, dumps
 from .matrix import loadints, ncol, atleast_4d
 from .ops import first, second, firstfloat, firststr, ravel, removenone, lenforeach, ceildiv
 from .path import findpaths, splitext, resolve, isempty
@@ -33,6 +34,8 @@ __all__ = [
     "b32digest",
     "niftidim",
     "nvol",
+    "NumpyJSONEncoder",
+    "dumps",
     "loadints",
     "ncol",
     "atleast_4d",
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+
+import json
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class NumpyJSONEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, np.generic):
+            return o.item()
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        return super().default(o)
+
+
+def dumps(obj, **kwargs) -> str:
+    """
+    serialize to a json string, handling numpy scalars and arrays.
+    when orjson is available and no json.dumps keyword arguments are
+    requested, its c implementation is used
+    """
+    if orjson is not None and len(kwargs) == 0:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    kwargs.setdefault("cls", NumpyJSONEncoder)
+    return json.dumps(obj, **kwargs)
@@ -59,25 +59,32 @@ def ravel(obj):
     if isinstance(obj, (str, dict)):
         return obj
 
+    try:
+        stack = [iter(obj)]
+    except TypeError:
+        return obj
+
     try:
 
         ret = []
-        for val in obj:
-            raveled_val = ravel(val)
-            if not isinstance(raveled_val, (str, dict)):
-                try:
-                    ret.extend(raveled_val)
-                    continue
-                except TypeError:
-                    pass
-            ret.append(raveled_val)
+        while stack:  # avoid recursion and its function call overhead
+            try:
+                val = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if isinstance(val, (str, dict)):
+                ret.append(val)
+                continue
+
+            try:
+                stack.append(iter(val))  # descend into nested iterable
+            except TypeError:
+                ret.append(val)
 
         return ret
 
-    except TypeError:
-        return obj
-    except StopIteration:
-        return []  # empty input
     except Exception:
         return []
 
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+
+import json
+
+import pytest
+
+import numpy as np
+
+from ..json import NumpyJSONEncoder, dumps
+
+
+@pytest.mark.timeout(60)
+def test_numpy_json_encoder():
+    obj = {"a": np.float64(1.5), "b": np.int32(2), "c": np.array([1.0, 2.0])}
+
+    assert json.loads(json.dumps(obj, cls=NumpyJSONEncoder)) == {
+        "a": 1.5,
+        "b": 2,
+        "c": [1.0, 2.0],
+    }
+
+
+@pytest.mark.timeout(60)
+def test_dumps():
+    obj = {"a": np.float64(1.5), "b": [np.int32(2), "x"]}
+
+    assert json.loads(dumps(obj)) == {"a": 1.5, "b": [2, "x"]}
+    assert json.loads(dumps(obj, sort_keys=True)) == {"a": 1.5, "b": [2, "x"]}